@@ -75,7 +75,10 @@ def mogrify(func, container):
     """
     def doit(x):
         # mutable containers
-        if isinstance(x, MutableSequence):
+        if type(x) is list:  # fast path: skip the abc check, replace contents in one slice assignment
+            x[:] = [doit(elt) for elt in x]
+            return x
+        elif isinstance(x, MutableSequence):
             y = [doit(elt) for elt in x]
             if hasattr(x, "clear"):
                 x.clear()  # list has this, but not guaranteed by MutableSequence
@@ -178,6 +181,7 @@ class box:
     for the particular situation. This class just makes the programmer's intent
     more explicit.
     """
+    __slots__ = ("x",)
     def __init__(self, x=None):
         self.x = x
     def __repr__(self):
@@ -507,13 +511,18 @@ class view(roview, MutableSequenceView):
     def __setitem__(self, k, v):
         data, r = self._update_cache()
         if isinstance(k, slice):
-            # TODO: would be nicer if we could convert a range into a slice, then just data[rk] = v.
-            # TODO: The problem is that we need transformations like range(4, -1, -1) --> slice(4, None, -1)
+            rk = r[k]
+            if type(data) is list and type(v) in (list, tuple) and len(v) == len(rk) and rk:
+                # fast path: convert the range into a slice, then just data[s] = v in one go.
+                # Need transformations like range(4, -1, -1) --> slice(4, None, -1).
+                stop = rk.stop if rk.stop >= 0 else None
+                data[rk.start:stop:rk.step] = v
+                return
             try:
                 vs = iter(v)
             except TypeError:  # scalar broadcast à la NumPy
                 vs = repeat(v)
-            for j, item in zip(r[k], vs):
+            for j, item in zip(rk, vs):
                 data[j] = item
         elif isinstance(k, tuple):
             raise TypeError("multidimensional subscripting not supported; got '{}'".format(k))
@@ -3,7 +3,7 @@
 
 __all__ = ["escape", "setescape", "call_ec"]
 
-from functools import wraps
+from functools import wraps, partial
 
 from .regutil import register_decorator
 
@@ -35,10 +35,14 @@ def escape(value, tag=None, allow_catchall=True):
     """
     raise Escape(value, tag, allow_catchall)
 
-class Escape(Exception):
+class Escape(BaseException):
     """Exception that essentially represents an escape continuation.
 
     Constructor parameters: see ``escape()``.
+
+    This inherits from ``BaseException`` (like ``GeneratorExit``), not from
+    ``Exception``, because an escape is control flow, not an error; so that
+    ``except Exception`` handlers in user code won't intercept it.
     """
     def __init__(self, value, tag=None, allow_catchall=True):
         self.value = value
@@ -154,25 +158,68 @@ def setescape(tags=None, catch_untagged=True):
     """
     if tags is not None:
         if isinstance(tags, tuple):  # multiple tags
-            tags = set(tags)
+            tags = frozenset(tags)
         else: # single tag
-            tags = set((tags,))
+            tags = frozenset((tags,))
+
+    # The catch condition depends only on the parameters of the @setescape
+    # point, so pick the appropriately specialized escape point here, once.
+    if tags is None:
+        make_escapepoint = _escapepoint_catchall_or_untagged if catch_untagged else _escapepoint_catchall
+    else:
+        make_escapepoint = partial(_escapepoint_tagged_or_untagged if catch_untagged else _escapepoint_tagged,
+                                   tags=tags)
 
     def decorator(f):
-        @wraps(f)
-        def escapepoint(*args, **kwargs):
-            try:
-                return f(*args, **kwargs)
-            except Escape as e:
-                if (tags is None and e.allow_catchall) or \
-                   (catch_untagged and e.tag is None) or \
-                   (tags is not None and e.tag is not None and e.tag in tags):
-                    return e.value
-                else:  # meant for someone else, pass it on
-                    raise
-        return escapepoint
+        return make_escapepoint(f)
     return decorator
 
+# Specialized escape points for setescape(). Each one contains only the part
+# of the catch condition that is live for its combination of parameters.
+def _escapepoint_catchall(f):  # tags is None, catch_untagged=False
+    @wraps(f)
+    def escapepoint(*args, **kwargs):
+        try:
+            return f(*args, **kwargs)
+        except Escape as e:
+            if e.allow_catchall:
+                return e.value
+            raise  # meant for someone else, pass it on
+    return escapepoint
+
+def _escapepoint_catchall_or_untagged(f):  # tags is None, catch_untagged=True
+    @wraps(f)
+    def escapepoint(*args, **kwargs):
+        try:
+            return f(*args, **kwargs)
+        except Escape as e:
+            if e.allow_catchall or e.tag is None:
+                return e.value
+            raise
+    return escapepoint
+
+def _escapepoint_tagged(f, tags):  # tags is not None, catch_untagged=False
+    @wraps(f)
+    def escapepoint(*args, **kwargs):
+        try:
+            return f(*args, **kwargs)
+        except Escape as e:
+            if e.tag is not None and e.tag in tags:
+                return e.value
+            raise
+    return escapepoint
+
+def _escapepoint_tagged_or_untagged(f, tags):  # tags is not None, catch_untagged=True
+    @wraps(f)
+    def escapepoint(*args, **kwargs):
+        try:
+            return f(*args, **kwargs)
+        except Escape as e:
+            if e.tag is None or e.tag in tags:
+                return e.value
+            raise
+    return escapepoint
+
 @register_decorator(priority=80)
 def call_ec(f):
     """Decorator. Call with escape continuation (call/ec).
@@ -187,7 +234,7 @@ def call_ec(f):
             of the ``call_ec``.
 
             The ec instance and the escape point are connected one-to-one.
-            Both are tagged with a process-wide unique id. The ec is set to
+            Both are tagged with a unique object. The ec is set to
             disallow catch-all (so that it will always reach its intended
             destination), and the point is set to ignore any untagged escapes
             (so that it catches only this particular ec).
@@ -221,9 +268,10 @@ def call_ec(f):
 
     Similar usage is valid for named functions, too.
     """
-    # Create a process-wide unique id to tag the ec:
-    anchor = object()
-    uid = id(anchor)
+    # Create a unique tag for the ec. Nothing else "is" this object, and it
+    # is alive for as long as the ec can be raised, so it can't collide with
+    # any other tag.
+    uid = object()
     # Closure property important here. "ec" itself lives as long as someone
     # retains a reference to it. It's a first-class value; the callee could
     # return it or stash it somewhere.
@@ -237,13 +285,20 @@ def call_ec(f):
         if not ec_valid:
             raise RuntimeError("Cannot escape after the dynamic extent of the call_ec invocation.")
         # Be catchable only by our own escape point.
-        escape(value, uid, allow_catchall=False)
+        # Raise directly; no need to go through escape() here.
+        raise Escape(value, uid, allow_catchall=False)
     try:
-        # Set up a tagged escape point that catches only the ec we just set up.
-        @setescape(uid, catch_untagged=False)
-        def wrapper():
+        # Set up an escape point that catches only the ec we just set up.
+        #
+        # This is equivalent to ``@setescape(uid, catch_untagged=False)``,
+        # but inlined, so that we don't need to build (and ``wraps``) a new
+        # decorated function at each call/ec invocation.
+        try:
             return f(ec)
-        return wrapper()
+        except Escape as e:
+            if e.tag is uid:
+                return e.value
+            raise  # meant for someone else, pass it on
     finally:  # Our dynamic extent ends; this ec instance is no longer valid.
               # Clear the flag (it will live on in the closure of the ec instance).
         ec_valid = False
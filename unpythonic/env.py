@@ -70,22 +70,27 @@ class env:
             return super().__setattr__(name, value)
         if name in self._reserved_names:
             raise AttributeError("cannot overwrite reserved name '{:s}'; complete list: {}".format(name, self._reserved_names))
-        if self._finalized and name not in self:
+        e = self._env
+        if self._finalized and name not in e:
             raise AttributeError("name '{:s}' is not defined; adding new bindings to a finalized environment is not allowed".format(name))
         # Block invalid names in subscripting (which redirects here).
         if not name.isidentifier():
             raise ValueError("'{}' is not a valid identifier".format(name))
 #        value = self._wrap(name, value)  # for "e.x << value" rebind syntax.
-        self._env[name] = value  # make all other attrs else live inside _env
+        e[name] = value  # make all other attrs else live inside _env
 
     def __getattr__(self, name):
+        e = self._env   # __getattr__ not called if direct attr lookup succeeds, no need for hook.
+        # Only valid identifiers can be bound (see __setattr__), so we only
+        # need to check validity when the lookup fails.
+        try:
+            return e[name]
+        except KeyError:
+            pass
         # Block invalid names in subscripting (which redirects here).
         if not name.isidentifier():
             raise ValueError("'{}' is not a valid identifier".format(name))
-        e = self._env   # __getattr__ not called if direct attr lookup succeeds, no need for hook.
-        if name not in e:
-            raise AttributeError("name '{:s}' is not defined".format(name))
-        return e[name]
+        raise AttributeError("name '{:s}' is not defined".format(name))
 
     def __delattr__(self, name):
         if not name.isidentifier():
@@ -150,7 +155,10 @@ class env:
 
     # subscripting
     def __getitem__(self, k):
-        return getattr(self, k)
+        try:  # fast path: a binding
+            return self._env[k]
+        except KeyError:  # anything else behaves as attribute access
+            return getattr(self, k)
 
     def __setitem__(self, k, v):
         setattr(self, k, v)
@@ -50,17 +50,19 @@ __all__ = ["fix"]
 import typing
 import threading
 from functools import wraps
-from operator import itemgetter
 
-from .fun import identity, const
-from .env import env
+from .fun import identity
+
+_missing = object()  # sentinel
 
 # Thread-local visited and cache.
 _L = threading.local()
 def _get_threadlocals():
-    if not hasattr(_L, "_data"):
-        _L._data = env(visited=set(), cache={})
-    return _L._data
+    try:
+        return _L._data
+    except AttributeError:  # first use in this thread
+        data = _L._data = (set(), {})  # visited, cache
+        return data
 
 # - TODO: Can we make this call bottom at most once?
 #
@@ -72,7 +74,7 @@ def _get_threadlocals():
 #   actual entrypoint in user code may require some trickery due to the decorator wrappers.
 #
 infinity = float("+inf")
-def fix(bottom=typing.NoReturn, n=infinity, unwrap=identity):
+def fix(bottom=typing.NoReturn, n=infinity, unwrap=identity, key=None):
     """Break recursion cycles. Parametric decorator.
 
     This is sometimes useful for recursive pattern-matching definitions. For an
@@ -106,6 +108,7 @@ def fix(bottom=typing.NoReturn, n=infinity, unwrap=identity):
       - `f` must be pure for this to make sense.
 
       - All args of `f` must be hashable, for technical reasons.
+        (Unless you provide a `key`; see below.)
 
       - The return value of `f` must support comparison with `!=`.
 
@@ -135,6 +138,14 @@ def fix(bottom=typing.NoReturn, n=infinity, unwrap=identity):
       - `n` is the maximum number of times recursion is allowed to occur,
         before the algorithm aborts. Default is no limit.
 
+      - `key`, if given, is called with the same args and kwargs as `f`, and
+        its return value (which must be hashable) is used to identify the call
+        when detecting cycles and caching return values. Calls with equal keys
+        are considered the same.
+
+        This is useful if the args of `f` are not hashable, or expensive to
+        hash. By default, the args and kwargs themselves are used.
+
     **CAUTION**: Worded differently, this function solves a small subset of the
     halting problem. This should be hint enough that it will only work for the
     advertised class of special cases - i.e., recursion cycles.
@@ -146,33 +157,56 @@ def fix(bottom=typing.NoReturn, n=infinity, unwrap=identity):
     # Being a class, typing.NoReturn is technically callable (to construct an
     # instance), but because it's an abstract class, the call raises TypeError.
     # We want to use the class itself as a data value, so we special-case it.
-    if bottom is typing.NoReturn or not callable(bottom):
-        bottom = const(bottom)
+    #
+    # When bottom is a plain value, we use it as-is, instead of wrapping it
+    # with ``const``; there is no need to pay for a call (and for packing the
+    # args) each time a cycle is detected.
+    bottom_is_value = bottom is typing.NoReturn or not callable(bottom)
+    # Skip the call to unwrap in the common case where it does nothing.
+    must_unwrap = unwrap is not identity
     def decorator(f):
         @wraps(f)
         def f_fix(*args, **kwargs):
-            e = _get_threadlocals()
-            me = (f_fix, args, tuple(sorted(kwargs.items(), key=itemgetter(0))))
-            if not e.visited:
-                value, e.cache[me] = None, bottom(f_fix.__name__, *args, **kwargs)
+            visited, cache = _get_threadlocals()
+            # Sorting the kwargs makes the key independent of the order they were passed in.
+            # No key function needed; the names are unique, so the values are never compared.
+            if key is not None:
+                me = (f_fix, key(*args, **kwargs))
+            else:
+                me = (f_fix, args, tuple(sorted(kwargs.items()))) if kwargs else (f_fix, args)
+            if not visited:
+                # Nothing else writes cache[me] while we run, because me is
+                # in visited, so we can track its latest value in a local.
+                value = None
+                latest = bottom if bottom_is_value else bottom(f_fix.__name__, *args, **kwargs)
+                cache[me] = latest
                 count = 0
-                while count < n and value != e.cache[me]:
+                while count < n and value != latest:
                     try:
-                        e.visited.add(me)
-                        value, e.cache[me] = e.cache[me], unwrap(f(*args, **kwargs))
+                        visited.add(me)
+                        value, latest = latest, f(*args, **kwargs)
+                        if must_unwrap:
+                            latest = unwrap(latest)
+                        cache[me] = latest
                     finally:
-                        e.visited.clear()
+                        visited.clear()
                     count += 1
                 return value
-            if me in e.visited:
-                # return e.cache.get(me, bottom(f_fix.__name__, *args)
+            if me in visited:
+                # return cache.get(me, bottom(f_fix.__name__, *args)
                 # same effect, except don't compute bottom again if we don't need to.
-                return e.cache[me] if me in e.cache else bottom(f_fix.__name__, *args, **kwargs)
+                value = cache.get(me, _missing)
+                if value is not _missing:
+                    return value
+                return bottom if bottom_is_value else bottom(f_fix.__name__, *args, **kwargs)
             try:
-                e.visited.add(me)
-                value = e.cache[me] = unwrap(f(*args, **kwargs))
+                visited.add(me)
+                value = f(*args, **kwargs)
+                if must_unwrap:
+                    value = unwrap(value)
+                cache[me] = value
             finally:
-                e.visited.remove(me)
+                visited.remove(me)
             return value
         f_fix.entrypoint = f  # just for information
         return f_fix
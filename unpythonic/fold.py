@@ -64,7 +64,7 @@ def scanl(proc, init, iterable0, *iterables, longest=False, fillvalue=None):
     acc = init
     yield acc
     for xs in z(iterable0, *iterables):
-        acc = proc(*(xs + (acc,)))
+        acc = proc(*xs, acc)
         yield acc
 
 def scanr(proc, init, iterable0, *iterables, longest=False, fillvalue=None):
@@ -114,7 +114,7 @@ def scanr(proc, init, iterable0, *iterables, longest=False, fillvalue=None):
 #    que = deque()
 #    que.appendleft(acc)
 #    for xs in xss:
-#        acc = proc(*(xs + (acc,)))
+#        acc = proc(*xs, acc)
 #        que.appendleft(acc)
 #    yield from que
 
@@ -122,7 +122,7 @@ def scanr(proc, init, iterable0, *iterables, longest=False, fillvalue=None):
     acc = init
     yield acc
     for xs in xss:
-        acc = proc(*(xs + (acc,)))
+        acc = proc(*xs, acc)
         yield acc
 
 
@@ -150,7 +150,7 @@ def scanr(proc, init, iterable0, *iterables, longest=False, fillvalue=None):
 #
 #        # In case of all but the outermost generator, their final result has already
 #        # been read by the next(subgen), so they have only the last two yields remaining.
-#        yield proc(*(xs + (acc,)))   # final result
+#        yield proc(*xs, acc)   # final result
 #        yield acc                    # previous result
 #        yield from subgen            # sustain the chain
 #    return _scanr_recurser()
@@ -172,7 +172,7 @@ def scanl1(proc, iterable, init=None):
         assert tuple(pprods(data)) == (1, 2, 6, 24)
     """
     it = iter(iterable)
-    if not init:
+    if init is None:
         try:
             init = next(it)
         except StopIteration:
@@ -201,15 +201,29 @@ def foldl(proc, init, iterable0, *iterables, longest=False, fillvalue=None):
     Note order: ``proc(elt, acc)``, which is the opposite order of arguments
     compared to ``functools.reduce``. General case ``proc(e1, ..., en, acc)``.
     """
-    return last(scanl(proc, init, iterable0, *iterables,
-                      longest=longest, fillvalue=fillvalue))
+    # Same as last(scanl(...)), but without the generator in between.
+    acc = init
+    if not iterables:  # single input, the usual case; no need to zip
+        for x in iterable0:
+            acc = proc(x, acc)
+        return acc
+    z = zip if not longest else partial(zip_longest, fillvalue=fillvalue)
+    for xs in z(iterable0, *iterables):
+        acc = proc(*xs, acc)
+    return acc
 
 def foldr(proc, init, iterable0, *iterables, longest=False, fillvalue=None):
     """Dual of foldl; fold from the right."""
-    # if using the haskelly result ordering in scanr, then first(...);
-    # if ordering results as they are computed, then last(...)
-    return last(scanr(proc, init, iterable0, *iterables,
-                      longest=longest, fillvalue=fillvalue))
+    # Same as last(scanr(...)), but without the generator in between.
+    acc = init
+    if not iterables:  # single input; if it is a sequence, walk it backwards without copying
+        for x in rev(iterable0):
+            acc = proc(x, acc)
+        return acc
+    z = zip if not longest else partial(zip_longest, fillvalue=fillvalue)
+    for xs in rev(z(iterable0, *iterables)):  # sync left ends; reverse
+        acc = proc(*xs, acc)
+    return acc
 
 def reducel(proc, iterable, init=None):
     """Foldl for a single iterable, with optional init.
@@ -217,7 +231,17 @@ def reducel(proc, iterable, init=None):
     If ``init is None``, use the first element from the iterable.
 
     Like ``functools.reduce``, but uses ``proc(elt, acc)`` like Racket."""
-    return last(scanl1(proc, iterable, init))
+    # Direct loop; no need to build and drain a scanl1 generator.
+    it = iter(iterable)
+    if init is None:
+        try:
+            init = next(it)
+        except StopIteration:
+            return None  # empty input iterable
+    acc = init
+    for x in it:
+        acc = proc(x, acc)
+    return acc
 
 def reducer(proc, iterable, init=None):
     """Dual of reducel.
@@ -18,7 +18,9 @@ __all__ = ["memoize", "curry", "iscurried",
            "withself"]
 
 from functools import wraps, partial
-from operator import itemgetter
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+from threading import Lock
 
 from .arity import arities, UnknownArity
 from .fold import reducel
@@ -28,8 +30,12 @@ from .regutil import register_decorator
 # we use @mark_lazy (and handle possible lazy args) to support unpythonic.syntax.lazify.
 from .lazyutil import mark_lazy, islazy, force, force1, lazycall
 
+_missing = object()  # sentinel
+_failed = object()  # marks memo entries whose call raised; the exception is in the errors dict
+_kwargs_key = object()  # marks memo keys that have kwargs, so they can't collide with a plain args tuple
+
 @register_decorator(priority=10)
-def memoize(f):
+def memoize(f=None, *, maxsize=None):
     """Decorator: memoize the function f.
 
     All of the args and kwargs of ``f`` must be hashable.
@@ -38,24 +44,94 @@ def memoize(f):
     is invoked again with arguments with which ``f`` originally raised an
     exception, *the same exception instance* is raised again.
 
+    By default, the memo grows without bound. To keep only the ``maxsize``
+    most recently used entries, use the parametric form::
+
+        @memoize(maxsize=128)
+        def f(x):
+            ...
+
+    The memoized function has a ``cache_clear()`` method, which empties the memo.
+
     **CAUTION**: ``f`` must be pure (no side effects, no internal state
     preserved between invocations) for this to make any sense.
     """
-    success, fail = [object() for _ in range(2)]
+    if f is None:  # parametric form, @memoize(maxsize=...)
+        return lambda f: memoize(f, maxsize=maxsize)
+    if maxsize is not None:
+        return _memoize_lru(f, maxsize)
     memo = {}
+    errors = {}  # kept separate, so that the usual case needs no unpacking
+    @wraps(f)
+    def memoized(*args, **kwargs):
+        # The args tuple itself is the key when there are no kwargs (the usual case).
+        # A frozenset makes the key independent of the order the kwargs were passed in.
+        k = (_kwargs_key, args, frozenset(kwargs.items())) if kwargs else args
+        value = memo.get(k, _missing)  # yells if k is not a valid key
+        if value is not _missing:
+            return value
+        err = errors.get(k)
+        if err is not None:
+            raise err
+        try:
+            value = memo[k] = lazycall(f, *args, **kwargs)
+        except BaseException as err:
+            errors[k] = err
+            raise
+        return value
+    def cache_clear():
+        memo.clear()
+        errors.clear()
+    memoized.cache_clear = cache_clear
+    if islazy(f):
+        memoized = mark_lazy(memoized)
+    return memoized
+
+def _memoize_lru(f, maxsize):
+    """Internal. Memoize f, keeping only the maxsize most recently used entries.
+
+    Same layout as the unbounded memo: values in ``memo``, exceptions in
+    ``errors``. Here ``memo`` also tracks the recency order, so a key whose
+    call raised maps to ``_failed`` there.
+    """
+    if maxsize < 1:
+        raise ValueError("maxsize must be at least 1, got {}".format(maxsize))
+    memo = OrderedDict()
+    errors = {}
+    lock = Lock()  # lookup-and-reorder and evict-and-store must not interleave between threads
+    def store(k, value, err=None):
+        with lock:
+            if k not in memo and len(memo) >= maxsize:  # another thread may have stored k meanwhile
+                oldk, _ = memo.popitem(last=False)  # evict the least recently used
+                errors.pop(oldk, None)
+            memo[k] = value
+            memo.move_to_end(k)
+            if err is not None:
+                errors[k] = err
+            else:
+                errors.pop(k, None)
     @wraps(f)
     def memoized(*args, **kwargs):
-        k = (args, tuple(sorted(kwargs.items(), key=itemgetter(0))))
-        if k not in memo:
-            try:
-                result = (success, lazycall(f, *args, **kwargs))
-            except BaseException as err:
-                result = (fail, err)
-            memo[k] = result  # should yell separately if k is not a valid key
-        kind, value = memo[k]
-        if kind is fail:
-            raise value
+        k = (_kwargs_key, args, frozenset(kwargs.items())) if kwargs else args
+        with lock:
+            value = memo.get(k, _missing)  # yells if k is not a valid key
+            if value is not _missing:
+                memo.move_to_end(k)
+                if value is _failed:
+                    raise errors[k]
+                return value
+        try:
+            value = lazycall(f, *args, **kwargs)
+        except BaseException as err:
+            store(k, _failed, err)
+            raise
+        store(k, value)
         return value
+    def cache_clear():
+        with lock:
+            memo.clear()
+            errors.clear()
+    memoized.cache_clear = cache_clear
     if islazy(f):
         memoized = mark_lazy(memoized)
     return memoized
@@ -64,7 +140,7 @@ def memoize(f):
 #    memo = {}
 #    @wraps(f)
 #    def memoized(*args, **kwargs):
-#        k = (args, tuple(sorted(kwargs.items(), key=itemgetter(0))))
+#        k = (args, frozenset(kwargs.items()))
 #        if k not in memo:
 #            memo[k] = f(*args, **kwargs)
 #        return memo[k]
@@ -185,7 +261,7 @@ def curry(f, *args, _curry_force_call=False, _curry_allow_uninspectable=False, *
     # TODO: improve: all required name-only args should be present before calling f.
     # Difficult, partial() doesn't remove an already-set kwarg from the signature.
     try:
-        min_arity, max_arity = arities(f)
+        min_arity, max_arity = _cached_arities(f)
     except UnknownArity:  # likely a builtin
         if not _curry_allow_uninspectable:  # usual behavior
             raise
@@ -193,7 +269,34 @@ def curry(f, *args, _curry_force_call=False, _curry_allow_uninspectable=False, *
         if args or kwargs or _curry_force_call:
             return lazycall(f, *args, **kwargs)
         return f
-    @wraps(f)
+    curried = wraps(f)(_curry(f, min_arity, max_arity))
+    # curry itself is curried: if we get args, they're the first step
+    if args or kwargs or _curry_force_call:
+        return lazycall(curried, *args, **kwargs)
+    return curried
+
+# Inspecting the signature is expensive, and the same functions tend to get curried
+# over and over (e.g. curry(foldr, ...) in a function body). Weak keys, so that we
+# don't keep alive any functions (e.g. lambdas) that would otherwise be discarded.
+_arities_cache = WeakKeyDictionary()
+def _cached_arities(f):
+    """Internal. Like ``arities(f)``, but cached when ``f`` is weakly referenceable."""
+    try:
+        return _arities_cache[f]
+    except KeyError:
+        pass
+    except TypeError:  # cannot be weakly referenced (e.g. some builtins), or not hashable
+        return arities(f)
+    result = _arities_cache[f] = arities(f)
+    return result
+
+def _curry(f, min_arity, max_arity):
+    """Internal. Make the curried wrapper for f, whose arities are already known.
+
+    The caller is responsible for copying any metadata (``functools.wraps``)
+    from a user-given ``f``. For the partials built at each step of the curry
+    chain, there is nothing useful to copy, so we skip it there.
+    """
     def curried(*args, **kwargs):
         outerctx = dyn.curry_context
         with dyn.let(curry_context=(outerctx + [f])):
@@ -201,7 +304,12 @@ def curry(f, *args, _curry_force_call=False, _curry_allow_uninspectable=False, *
                 p = partial(f, *args, **kwargs)
                 if islazy(f):
                     p = mark_lazy(p)
-                return curry(p)
+                if kwargs:  # may change which parameters are positional; need to inspect again
+                    return curry(p)
+                # Positional args fill the leftmost positional parameters,
+                # so we know the arities of p without inspecting it.
+                n = len(args)
+                return _curry(p, min_arity - n, max_arity - n)
             # passthrough on right, like https://github.com/Technologicat/spicy
             if len(args) > max_arity:
                 now_args, later_args = args[:max_arity], args[max_arity:]
@@ -224,10 +332,8 @@ def curry(f, *args, _curry_force_call=False, _curry_allow_uninspectable=False, *
             return lazycall(f, *args, **kwargs)
     if islazy(f):
         curried = mark_lazy(curried)
+    curried.__wrapped__ = f  # let inspect.signature see through
     curried._is_curried_function = True  # stash for detection
-    # curry itself is curried: if we get args, they're the first step
-    if args or kwargs or _curry_force_call:
-        return lazycall(curried, *args, **kwargs)
     return curried
 
 def iscurried(f):
@@ -441,7 +547,11 @@ def _make_compose1(direction):  # "left", "right"
         # Using reducel is particularly nice here:
         #  - if fs is empty, we output None
         #  - if fs contains only one item, we output it as-is
-        composed = reducel(compose1_two, fs)  # op(elt, acc)
+        fs = tuple(fs)  # we iterate twice; also, fs may be a generator
+        if len(fs) == 2:  # the common case; skip the fold
+            composed = compose1_two(fs[1], fs[0])  # op(elt, acc)
+        else:
+            composed = reducel(compose1_two, fs)  # op(elt, acc)
         if all(islazy(f) for f in fs):
             composed = mark_lazy(composed)
         return composed
@@ -484,26 +594,36 @@ def composel1i(iterable):
 
 def _make_compose(direction):  # "left", "right"
     def compose_two(f, g):
-        def composed(*args):
-            bindings = {}
-            if iscurried(f):
+        # Decide once, here, whether we need the curry context; that way the
+        # usual case doesn't need to enter a dynamic scope at each call.
+        if iscurried(f):
+            def composed(*args):
                 # co-operate with curry: provide a top-level curry context
                 # to allow passthrough from the function that is applied first
                 # to the function that is applied second.
-                bindings = {"curry_context": dyn.curry_context + [composed]}
-            with dyn.let(**bindings):
+                with dyn.let(curry_context=(dyn.curry_context + [composed])):
+                    a = lazycall(g, *args)
+                if isinstance(a, tuple):
+                    return lazycall(f, *a)
+                return lazycall(f, a)
+        else:
+            def composed(*args):
                 a = lazycall(g, *args)
-            # we could duck-test, but this is more predictable for the user
-            # (consider chaining functions that manipulate a generator), and
-            # tuple specifically is the pythonic multiple-return-values thing.
-            if isinstance(a, tuple):
-                return lazycall(f, *a)
-            return lazycall(f, a)
+                # we could duck-test, but this is more predictable for the user
+                # (consider chaining functions that manipulate a generator), and
+                # tuple specifically is the pythonic multiple-return-values thing.
+                if isinstance(a, tuple):
+                    return lazycall(f, *a)
+                return lazycall(f, a)
         return composed
     if direction == "right":
         compose_two = flip(compose_two)
     def compose(fs):
-        composed = reducel(compose_two, fs)  # op(elt, acc)
+        fs = tuple(fs)  # we iterate twice; also, fs may be a generator
+        if len(fs) == 2:  # the common case; skip the fold
+            composed = compose_two(fs[1], fs[0])  # op(elt, acc)
+        else:
+            composed = reducel(compose_two, fs)  # op(elt, acc)
         if all(islazy(f) for f in fs):
             composed = mark_lazy(composed)
         return composed
@@ -579,17 +699,10 @@ def tokth(k, f):
         n = len(args)
         if not n:
             raise TypeError("Expected at least one argument")
-        if not -n < k < n:  # standard semantics for negative indices
-            raise IndexError("Should have -n < k < n, but n = len(args) = {}, and k = {}".format(n, k))
+        if not -n <= k < n:  # standard semantics for negative indices
+            raise IndexError("Should have -n <= k < n, but n = len(args) = {}, and k = {}".format(n, k))
         j = k % n
-        m = j + 1
-        if n < m:
-            raise TypeError("Expected at least {:d} arguments, got {:d}".format(m, n))
-        out = list(args[:j])
-        out.append(lazycall(f, args[j]))  # mth argument
-        if n > m:
-            out.extend(args[m:])
-        return tuple(out)
+        return args[:j] + (lazycall(f, args[j]),) + args[j + 1:]
     if islazy(f):
         apply_f_to_kth_arg = mark_lazy(apply_f_to_kth_arg)
     return apply_f_to_kth_arg
@@ -605,15 +718,37 @@ def to1st(f):
         double = lambda x: 2 * x
         assert mymap_one(double, (1, 2, 3)) == (2, 4, 6)
     """
-    return tokth(0, f)  # this is just a partial() but we want to provide a docstring.
+    # Specialized versions of tokth; these are often in the inner loop of a fold.
+    def apply_f_to_first_arg(*args):
+        if not args:
+            raise TypeError("Expected at least one argument")
+        return (lazycall(f, args[0]),) + args[1:]
+    if islazy(f):
+        apply_f_to_first_arg = mark_lazy(apply_f_to_first_arg)
+    return apply_f_to_first_arg
 
 def to2nd(f):
     """Return a function to apply f to second item in args, pass the rest through."""
-    return tokth(1, f)
+    def apply_f_to_second_arg(*args):
+        n = len(args)
+        if not n:
+            raise TypeError("Expected at least one argument")
+        if n < 2:
+            raise IndexError("Should have -n <= k < n, but n = len(args) = {}, and k = 1".format(n))
+        return (args[0], lazycall(f, args[1])) + args[2:]
+    if islazy(f):
+        apply_f_to_second_arg = mark_lazy(apply_f_to_second_arg)
+    return apply_f_to_second_arg
 
 def tolast(f):
     """Return a function to apply f to last item in args, pass the rest through."""
-    return tokth(-1, f)
+    def apply_f_to_last_arg(*args):
+        if not args:
+            raise TypeError("Expected at least one argument")
+        return args[:-1] + (lazycall(f, args[-1]),)
+    if islazy(f):
+        apply_f_to_last_arg = mark_lazy(apply_f_to_last_arg)
+    return apply_f_to_last_arg
 
 def to(*specs):
     """Return a function to apply f1, ..., fn to items in args, pass the rest through.
@@ -630,8 +765,27 @@ def to(*specs):
 
     Returns:
         Function to (functionally) update args with the specs applied.
+
+        With no specs, the returned function passes its args through unchanged,
+        as a tuple. (Previously, ``to()`` raised ``TypeError``, because the
+        composition of zero functions was not defined.)
     """
-    return composeli(tokth(k, f) for k, f in specs)
+    # Equivalent to composeli(tokth(k, f) for k, f in specs), but build the
+    # output only once, instead of once per spec.
+    specs = tuple(specs)
+    def apply_fs_to_args(*args):
+        n = len(args)
+        if not n:
+            raise TypeError("Expected at least one argument")
+        out = list(args)
+        for k, f in specs:
+            if not -n <= k < n:  # standard semantics for negative indices
+                raise IndexError("Should have -n <= k < n, but n = len(args) = {}, and k = {}".format(n, k))
+            out[k] = lazycall(f, out[k])
+        return tuple(out)
+    if all(islazy(f) for _, f in specs):
+        apply_fs_to_args = mark_lazy(apply_fs_to_args)
+    return apply_fs_to_args
 
 @register_decorator(priority=80)
 def withself(f):
@@ -112,6 +112,19 @@ def fupdate(target, indices=None, values=None, **bindings):
             return ctor(gen)
         if not isinstance(indices, (list, tuple)):
             # one index (or slice), value(s) pair only
+            cls = type(target)
+            if cls is list or cls is tuple:
+                l = len(target)
+                if type(indices) is int and -l <= indices < l:
+                    # fast path: one item in a list or tuple; two slices and a concatenation
+                    i = indices % l
+                    return target[:i] + cls((values,)) + target[i + 1:]
+                if type(indices) is slice and type(values) in (list, tuple) \
+                   and len(values) == len(range(l)[indices]):
+                    # fast path: exactly as many values as the slice has items; one slice assignment
+                    out = list(target)
+                    out[indices] = values
+                    return out if cls is list else cls(out)
             return make_output(ShadowedSequence(target, indices, values))
         seq = target
         for index, value in zip(indices, values):
@@ -6,7 +6,6 @@ or iterators created by factory functions."""
 
 __all__ = ["gmemoize", "imemoize", "fimemoize"]
 
-from operator import itemgetter
 from functools import wraps
 from threading import RLock
 
@@ -93,11 +92,13 @@ def gmemoize(gfunc):
     memos = {}
     @wraps(gfunc)
     def gmemoized(*args, **kwargs):
-        k = (args, tuple(sorted(kwargs.items(), key=itemgetter(0))))
-        if k not in memos:
+        # kwargs names are unique, so the sort never needs to compare values.
+        k = (args, tuple(sorted(kwargs.items())))
+        entry = memos.get(k)
+        if entry is None:
             # underlying generator instance, memo instance, lock instance
-            memos[k] = (gfunc(*args, **kwargs), [], RLock())
-        return _MemoizedGenerator(*memos[k])
+            entry = memos[k] = (gfunc(*args, **kwargs), [], RLock())
+        return _MemoizedGenerator(*entry)
     return gmemoized
 
 _success, _fail = [object() for _ in range(2)]  # global saves indirect via self
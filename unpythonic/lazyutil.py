@@ -27,6 +27,9 @@ except ImportError:
 
 make_dynvar(_build_lazy_trampoline=False)  # interaction with TCO
 
+# types that mogrify treats as atoms (exact types only; subclasses take the general path)
+_atom_types = frozenset((int, float, complex, bool, str, type(None)))
+
 # -----------------------------------------------------------------------------
 
 @register_decorator(priority=95)
@@ -51,7 +54,8 @@ def lazycall(f, *thunks, **kwthunks):
         return jump(force1(target), *argthunks, **kwthunks)
     if islazy(f):
         return f(*thunks, **kwthunks)
-    return f(*force(thunks), **force(kwthunks))
+    # Force each arg separately, so that the fast paths in force() apply.
+    return f(*[force(x) for x in thunks], **{k: force(v) for k, v in kwthunks.items()})
 
 # Because force(x) is more explicit than x() and MacroPy itself doesn't define this.
 def force1(x):
@@ -74,4 +78,10 @@ def force(x):
     """
     if not _init_done:
         return x
+    # Fast paths for a bare promise and for common atoms; mogrify would
+    # reach the same result, but only after a chain of abc checks.
+    if isinstance(x, Lazy):
+        return x()
+    if type(x) in _atom_types:
+        return x
     return mogrify(force1, x)  # in-place update to allow lazy functions to have writable list arguments
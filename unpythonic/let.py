@@ -5,7 +5,6 @@ __all__ = ["let", "letrec", "dlet", "dletrec", "blet", "bletrec"]
 
 from functools import wraps
 
-from .misc import call
 from .env import env as _envcls
 from .arity import arity_includes, UnknownArity
 
@@ -244,8 +243,12 @@ def _let(mode, body, **bindings):
     # wrappers in a second pass, we lose this validation, because all names
     # are then already bound when the wrappers are called.
     env = _envcls()
+    # The env is not finalized yet, so for plain names we can skip the
+    # attribute dispatch and write into the underlying dict directly.
+    e = env._env
+    reserved = env._reserved_names
     for k, v in bindings.items():
-        if k in env:
+        if k in e:
             raise AttributeError("Cannot rebind the same name '{}' in a {} initializer list".format(k, mode))
         if mode == "letrec" and callable(v):
             try:
@@ -254,7 +257,10 @@ def _let(mode, body, **bindings):
             except UnknownArity:  # well, we tried!
                 pass
             v = v(env)
-        env[k] = v
+        if k in reserved or not k.isidentifier():
+            env[k] = v  # let env raise the appropriate error
+        else:
+            e[k] = v
     # decorators need just the final env; else run body now
     env.finalize()
     if body:
@@ -283,7 +289,8 @@ def _dlet(mode, _envname="env", **bindings):
     return deco
 
 def _blet(mode, _envname="env", **bindings):
-    dlet_deco = _dlet(mode, _envname, **bindings)
+    # Same as call(_dlet(...)(body)), minus the throwaway withenv wrapper.
     def deco(body):
-        return call(dlet_deco(body))
+        env = _let(mode, body=None, **bindings)
+        return body(**{_envname: env})
     return deco
@@ -5,7 +5,6 @@ __all__ = ["let", "letrec", "dlet", "dletrec", "blet", "bletrec"]
 
 from functools import wraps
 
-from .misc import call
 from .env import env as _envcls
 from .arity import arity_includes, UnknownArity
 
@@ -262,7 +261,8 @@ def _dlet(bindings, mode="let", _envname="env"):  # let and letrec decorator fac
     return deco
 
 def _blet(bindings, mode="let", _envname="env"):
-    dlet_deco = _dlet(bindings, mode, _envname)
+    # Same as call(_dlet(...)(body)), minus the throwaway withenv wrapper.
     def deco(body):
-        return call(dlet_deco(body))
+        env = _let(bindings, body=None, mode=mode)
+        return body(**{_envname: env})
     return deco
@@ -9,6 +9,6 @@ except ImportError:
     AsyncFor = AsyncFunctionDef = AsyncWith = Await = MatMult = _NoSuchNodeType
 
 try:  # Python 3.6+
-    from ast import AnnAssign, FormattedValue, JoinedStr
+    from ast import AnnAssign, FormattedValue, JoinedStr, Constant
 except ImportError:
-    AnnAssign = FormattedValue = JoinedStr = _NoSuchNodeType
+    AnnAssign = FormattedValue = JoinedStr = Constant = _NoSuchNodeType
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 """Implicitly reference attributes of an object."""
 
-from ast import Name, Assign, Load, Call, Lambda, With, Str, arg, \
+from ast import Name, Assign, Load, Call, Lambda, With, Str, \
                 Attribute, Subscript, Store, Del
 
 from macropy.core.quotes import macros, q, u, name, ast_literal
@@ -113,14 +113,13 @@ def autoref(block_body, args, asname):
         assert type(tree) is Name and (type(tree.ctx) is Load or not tree.ctx)
         newtree = hq[(lambda __ar_: __ar_[1] if __ar_[0] else ast_literal[tree])(_autoref_resolve((name[o], u[tree.id])))]
         our_lambda_argname = gen_sym("_ar")
-        @Walker
-        def renametmp(tree, **kw):
-            if type(tree) is Name and tree.id == "__ar_":
-                tree.id = our_lambda_argname
-            elif type(tree) is arg and tree.arg == "__ar_":
-                tree.arg = our_lambda_argname
-            return tree
-        return renametmp.recurse(newtree)
+        # The template is fixed, so we know exactly where the temporary name
+        # occurs; rename it there, instead of walking the whole tree.
+        lam = newtree.func
+        lam.args.args[0].arg = our_lambda_argname
+        lam.body.test.value.id = our_lambda_argname  # __ar_[0]
+        lam.body.body.value.id = our_lambda_argname  # __ar_[1]
+        return newtree
 
     @Walker
     def transform(tree, *, referents, set_ctx, stop, **kw):
@@ -59,10 +59,12 @@ def dbgprint_block(ks, vs, *, filename=None, lineno=None, sep=", ", **kwargs):
     ``lineno`` attribute of the AST node.
     """
     header = "[{}:{}] ".format(filename, lineno)
+    # (str.join builds a list from a generator anyway, so give it one directly;
+    #  no f-strings, we support Python 3.4.)
     if "\n" in sep:
-        print(sep.join("{} {}: {}".format(header, k, v) for k, v in zip(ks, vs)), **kwargs)
+        print(sep.join([header + " {}: {}".format(k, v) for k, v in zip(ks, vs)]), **kwargs)
     else:
-        print(header + sep.join("{}: {}".format(k, v) for k, v in zip(ks, vs)), **kwargs)
+        print(header + sep.join(["{}: {}".format(k, v) for k, v in zip(ks, vs)]), **kwargs)
 
 def dbg_block(body, args):
     if args:  # custom print function hook
@@ -85,7 +87,7 @@ def dbg_block(body, args):
             tree.args = [names, values]
             # can't use inspect.stack in the printer itself because we want the line number *before macro expansion*.
             tree.keywords += [keyword(arg="filename", value=q[__file__]),
-                              keyword(arg="lineno", value=(q[u[tree.lineno]] if hasattr(tree, "lineno") else q[None]))]
+                              keyword(arg="lineno", value=q[u[getattr(tree, "lineno", None)]])]
             tree.func = q[ast_literal[p]]
         return tree
 
@@ -129,5 +131,4 @@ def dbgprint_expr(k, v, *, filename, lineno):
     return v  # IMPORTANT!
 
 def dbg_expr(tree):
-    ln = q[u[tree.lineno]] if hasattr(tree, "lineno") else q[None]
-    return q[dbgprint_expr(u[unparse(tree)], ast_literal[tree], filename=__file__, lineno=ast_literal[ln])]
+    return q[dbgprint_expr(u[unparse(tree)], ast_literal[tree], filename=__file__, lineno=u[getattr(tree, "lineno", None)])]
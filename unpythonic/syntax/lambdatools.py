@@ -68,7 +68,7 @@ def namedlambda(block_body):
     def nameit(myname, tree):
         match, thelambda = False, None
         # for decorated lambdas, match any chain of one-argument calls.
-        d = is_decorated_lambda(tree, mode="any") and not has_deco(tree, "namelambda")
+        d = is_decorated_lambda(tree, mode="any") and not has_deco(["namelambda"], tree)
         c = iscurrywithfinallambda(tree)
         # this matches only during the second pass (after "with curry" has expanded)
         # so it can't have namelambda already applied
@@ -53,8 +53,9 @@ from ..dynassign import dyn
 #
 # In any case, *args and **kwargs are lazified only if literal containers;
 # whatever they are, the result must be unpackable to perform the function call.
-_ctorcalls_map = ("frozendict", "dict")
-_ctorcalls_seq = ("list", "tuple", "set", "frozenset", "box", "cons", "llist", "ll")
+# (frozensets, so that recognizing a constructor is one lookup on getname(tree.func))
+_ctorcalls_map = frozenset(("frozendict", "dict"))
+_ctorcalls_seq = frozenset(("list", "tuple", "set", "frozenset", "box", "cons", "llist", "ll"))
 # when to lazify individual (positional, keyword) args.
 _ctor_handling_modes = {  # constructors that take iterable(s) as positional args.
                         "dict": ("literal_only", "all"),
@@ -68,73 +69,87 @@ _ctor_handling_modes = {  # constructors that take iterable(s) as positional arg
                         "box": ("all", "all"),
                         "cons": ("all", "all"),
                         "ll": ("all", "all")}
-_ctorcalls_all = _ctorcalls_map + _ctorcalls_seq
+_ctorcalls_all = _ctorcalls_map | _ctorcalls_seq
+
+# Python 3.4 has Call.starargs and Call.kwargs; 3.5+ uses Starred and keyword(arg=None).
+_py34_starargs = "starargs" in Call._fields
 
 islazy = make_isxpred("lazy")  # unexpanded
 isLazy = make_isxpred("Lazy")  # expanded
 def lazyrec(tree):
-    @Walker
-    def transform(tree, *, stop, **kw):
-        if type(tree) in (Tuple, List, Set):
-            stop()
-            tree.elts = [rec(x) for x in tree.elts]
-        elif type(tree) is Dict:
-            stop()
-            tree.values = [rec(x) for x in tree.values]
-        elif type(tree) is Call and any(isx(tree.func, ctor) for ctor in _ctorcalls_all):
-            stop()
-            p, k = _ctor_handling_modes[getname(tree.func)]
-            tree = lazify_ctorcall(tree, p, k)
-        # TODO: lazy[] seems to expand immediately even though quoted in our atom case?
-        # Seems that in MacroPy, quote doesn't prevent macro expansion; the lazy[] is injected
-        # by this module, so if all macros expand before the module runs, we will actually splice
-        # *expanded* lazy[] forms into the user code.
-        # Maybe could be worked around by not importing lazy here, but that defeats hygiene.
-        elif type(tree) is Subscript and isx(tree.value, islazy):  # unexpanded
-            stop()
-        elif type(tree) is Call and isx(tree.func, isLazy):  # expanded
-            stop()
-        else:
-            stop()
-            tree = hq[lazy[ast_literal[tree]]]
+    # Every case stops at the current node, so instead of a Walker, this is
+    # a plain recursive function that dispatches on the node type.
+    return _lazyrec_handlers.get(type(tree), _lazyrec_atom)(tree)
+
+def _lazyrec_elts(tree):  # Tuple, List, Set
+    tree.elts = [lazyrec(x) for x in tree.elts]
+    return tree
+
+def _lazyrec_dict(tree):
+    tree.values = [lazyrec(x) for x in tree.values]
+    return tree
+
+def _lazyrec_call(tree):
+    modes = _ctor_handling_modes.get(getname(tree.func))
+    if modes is not None:
+        _lazify_ctorcall(tree, *modes)
         return tree
-
-    def lazify_ctorcall(tree, positionals="all", keywords="all"):
-        newargs = []
-        for a in tree.args:
-            if type(a) is Starred:  # *args in Python 3.5+
-                if is_literal_container(a.value, maps_only=False):
-                    a.value = rec(a.value)
-                # else do nothing
-            elif positionals == "all" or is_literal_container(a, maps_only=False):  # single positional arg
-                a = rec(a)
-            newargs.append(a)
-        tree.args = newargs
-        for kw in tree.keywords:
-            if kw.arg is None:  # **kwargs in Python 3.5+
-                if is_literal_container(kw.value, maps_only=True):
-                    kw.value = rec(kw.value)
-                # else do nothing
-            elif keywords == "all" or is_literal_container(kw.value, maps_only=True):  # single named arg
-                kw.value = rec(kw.value)
-        # *args and **kwargs in Python 3.4
-        if hasattr(tree, "starargs"):
-            if tree.starargs is not None and is_literal_container(tree.starargs, maps_only=False):
-                tree.starargs = rec(tree.starargs)
-        if hasattr(tree, "kwargs"):
-            if tree.kwargs is not None and is_literal_container(tree.kwargs, maps_only=True):
-                tree.kwargs = rec(tree.kwargs)
-
-    rec = transform.recurse
-    return rec(tree)
+    if isx(tree.func, isLazy):  # expanded
+        return tree
+    return _lazyrec_atom(tree)
+
+# TODO: lazy[] seems to expand immediately even though quoted in our atom case?
+# Seems that in MacroPy, quote doesn't prevent macro expansion; the lazy[] is injected
+# by this module, so if all macros expand before the module runs, we will actually splice
+# *expanded* lazy[] forms into the user code.
+# Maybe could be worked around by not importing lazy here, but that defeats hygiene.
+def _lazyrec_subscript(tree):
+    if isx(tree.value, islazy):  # unexpanded
+        return tree
+    return _lazyrec_atom(tree)
+
+def _lazyrec_atom(tree):
+    return hq[lazy[ast_literal[tree]]]
+
+_lazyrec_handlers = {Tuple: _lazyrec_elts,
+                     List: _lazyrec_elts,
+                     Set: _lazyrec_elts,
+                     Dict: _lazyrec_dict,
+                     Call: _lazyrec_call,
+                     Subscript: _lazyrec_subscript}
+
+def _lazify_ctorcall(tree, positionals="all", keywords="all"):
+    newargs = []
+    for a in tree.args:
+        if type(a) is Starred:  # *args in Python 3.5+
+            if is_literal_container(a.value, maps_only=False):
+                a.value = lazyrec(a.value)
+            # else do nothing
+        elif positionals == "all" or is_literal_container(a, maps_only=False):  # single positional arg
+            a = lazyrec(a)
+        newargs.append(a)
+    tree.args = newargs
+    for kw in tree.keywords:
+        if kw.arg is None:  # **kwargs in Python 3.5+
+            if is_literal_container(kw.value, maps_only=True):
+                kw.value = lazyrec(kw.value)
+            # else do nothing
+        elif keywords == "all" or is_literal_container(kw.value, maps_only=True):  # single named arg
+            kw.value = lazyrec(kw.value)
+    if _py34_starargs:  # *args and **kwargs in Python 3.4
+        starargs, kwargs = getattr(tree, "starargs", None), getattr(tree, "kwargs", None)
+        if starargs is not None and is_literal_container(starargs, maps_only=False):
+            tree.starargs = lazyrec(starargs)
+        if kwargs is not None and is_literal_container(kwargs, maps_only=True):
+            tree.kwargs = lazyrec(kwargs)
 
 def is_literal_container(tree, maps_only=False):
     """Test whether tree is a container literal understood by lazyrec[]."""
-    if not maps_only:
-        if type(tree) in (List, Tuple, Set): return True
-        if type(tree) is Call and any(isx(tree.func, s) for s in _ctorcalls_seq): return True
     if type(tree) is Dict: return True
-    if type(tree) is Call and any(isx(tree.func, s) for s in _ctorcalls_map): return True
+    if not maps_only and type(tree) in (List, Tuple, Set): return True
+    if type(tree) is Call:
+        fname = getname(tree.func)
+        return fname in _ctorcalls_map or (not maps_only and fname in _ctorcalls_seq)
     return False
 
 # -----------------------------------------------------------------------------
@@ -160,55 +175,79 @@ def is_literal_container(tree, maps_only=False):
 #   - don't lazify "for", the loop counter changes value imperatively (and usually rather rapidly)
 # full list: see unpythonic.syntax.scoping.get_names_in_store_context (and the link therein)
 
+# Forcing references (Name, Attribute, Subscript):
+#   x -> f(x)
+#   a.x -> f(force1(a).x)
+#   a.b.x -> f(force1(force1(a).b).x)
+#   a[j] -> f((force1(a))[force(j)])
+#   a[j][k] -> f(force1(force1(a)[force(j)])[force(k)])
+#
+# where f is force, force1 or identity (optimized away) depending on
+# where the term appears; j and k may be indices or slices.
+#
+# Whenever not in Load context, f is identity.
+#
+# The idea is to apply just the right level of forcing to be able to
+# resolve the reference, and then decide what to do with the resolved
+# reference based on where it appears.
+#
+# For example, when subscripting a list, force1 it to unwrap it from
+# a promise if it happens to be inside one, but don't force its elements
+# just for the sake of resolving the reference. Then, apply f to the
+# whole subscript term (forcing the accessed slice of the list, if necessary).
+#
+# _force_by_mode is f. It lives at module level, so that the walker
+# doesn't have to build a new closure for it at every node.
+def _force_by_mode(tree, forcing_mode):
+    if type(tree.ctx) is Load:
+        if forcing_mode == "full":
+            return hq[force(ast_literal[tree])]
+        elif forcing_mode == "flat":
+            return hq[force1(ast_literal[tree])]
+        # else forcing_mode == "off"
+    return tree
+
 def lazify(body):
     # first pass, outside-in
     userlambdas = detect_lambda.collect(body)
     body = yield body
 
     # second pass, inside-out
+    #
+    # Helpers for the args of each Call; defined once, not per node.
+    def transform_arg(tree):
+        # add any needed force() invocations inside the tree,
+        # but leave the top level of simple references untouched.
+        isref = type(tree) in (Name, Attribute, Subscript)
+        tree = transform.recurse(tree, forcing_mode=("off" if isref else "full"))
+        if not isref:  # (re-)thunkify expr; a reference can be passed as-is.
+            tree = lazyrec(tree)
+        return tree
+
+    def transform_starred(tree, dstarred=False):
+        isref = type(tree) in (Name, Attribute, Subscript)
+        tree = transform.recurse(tree, forcing_mode=("off" if isref else "full"))
+        # lazify items if we have a literal container
+        # we must avoid lazifying any other exprs, since a Lazy cannot be unpacked.
+        if is_literal_container(tree, maps_only=dstarred):
+            tree = lazyrec(tree)
+        return tree
+
     @Walker
     def transform(tree, *, forcing_mode, stop, **kw):
         def rec(tree, forcing_mode=forcing_mode):  # shorthand that defaults to current mode
             return transform.recurse(tree, forcing_mode=forcing_mode)
 
-        # Forcing references (Name, Attribute, Subscript):
-        #   x -> f(x)
-        #   a.x -> f(force1(a).x)
-        #   a.b.x -> f(force1(force1(a).b).x)
-        #   a[j] -> f((force1(a))[force(j)])
-        #   a[j][k] -> f(force1(force1(a)[force(j)])[force(k)])
-        #
-        # where f is force, force1 or identity (optimized away) depending on
-        # where the term appears; j and k may be indices or slices.
-        #
-        # Whenever not in Load context, f is identity.
-        #
-        # The idea is to apply just the right level of forcing to be able to
-        # resolve the reference, and then decide what to do with the resolved
-        # reference based on where it appears.
-        #
-        # For example, when subscripting a list, force1 it to unwrap it from
-        # a promise if it happens to be inside one, but don't force its elements
-        # just for the sake of resolving the reference. Then, apply f to the
-        # whole subscript term (forcing the accessed slice of the list, if necessary).
-        def f(tree):
-            if type(tree.ctx) is Load:
-                if forcing_mode == "full":
-                    return hq[force(ast_literal[tree])]
-                elif forcing_mode == "flat":
-                    return hq[force1(ast_literal[tree])]
-                # else forcing_mode == "off"
-            return tree
-
-        if type(tree) in (FunctionDef, AsyncFunctionDef, Lambda):
-            if type(tree) is Lambda and id(tree) not in userlambdas:
+        tt = type(tree)
+        if tt in (FunctionDef, AsyncFunctionDef, Lambda):
+            if tt is Lambda and id(tree) not in userlambdas:
                 pass  # ignore macro-introduced lambdas
             else:
                 stop()
 
                 # mark this definition as lazy, and insert the interface wrapper
                 # to allow also strict code to call this function
-                if type(tree) is Lambda:
+                if tt is Lambda:
                     lam = tree
                     tree = hq[mark_lazy(ast_literal[tree])]
                     tree = sort_lambda_decorators(tree)
@@ -224,25 +263,7 @@ def lazify(body):
                         tree.decorator_list.append(hq[mark_lazy])
                     tree.body = rec(tree.body)
 
-        elif type(tree) is Call:
-            def transform_arg(tree):
-                # add any needed force() invocations inside the tree,
-                # but leave the top level of simple references untouched.
-                isref = type(tree) in (Name, Attribute, Subscript)
-                tree = rec(tree, forcing_mode=("off" if isref else "full"))
-                if not isref:  # (re-)thunkify expr; a reference can be passed as-is.
-                    tree = lazyrec(tree)
-                return tree
-
-            def transform_starred(tree, dstarred=False):
-                isref = type(tree) in (Name, Attribute, Subscript)
-                tree = rec(tree, forcing_mode=("off" if isref else "full"))
-                # lazify items if we have a literal container
-                # we must avoid lazifying any other exprs, since a Lazy cannot be unpacked.
-                if is_literal_container(tree, maps_only=dstarred):
-                    tree = lazyrec(tree)
-                return tree
-
+        elif tt is Call:
             # let bindings have a role similar to function arguments, so auto-lazify there
             # (LHSs are always new names, so no infinite loop trap for the unwary)
             if islet(tree):
@@ -262,8 +283,8 @@ def lazify(body):
             # Lazy() is a strict function, takes a lambda, constructs a Lazy object
             # _autoref_resolve doesn't need any special handling
             elif isdo(tree) or is_decorator(tree.func, "namelambda") or \
-               any(isx(tree.func, s) for s in _ctorcalls_all) or isx(tree.func, isLazy) or \
-               any(isx(tree.func, s) for s in ("_autoref_resolve", "AutorefMarker")):
+               getname(tree.func) in _ctorcalls_all or isx(tree.func, isLazy) or \
+               getname(tree.func) in ("_autoref_resolve", "AutorefMarker"):
                 # here we know the operator (.func) to be one of specific names;
                 # don't transform it to avoid confusing lazyrec[] (important if this
                 # is an inner call in the arglist of an outer, lazy call, since it
@@ -272,11 +293,11 @@ def lazify(body):
                 # TODO: correct forcing mode? We shouldn't need to forcibly use "full",
                 # since lazycall() already fully forces any remaining promises
                 # in the args when calling a strict function.
-                tree.args = rec(tree.args)
-                tree.keywords = rec(tree.keywords)
-                # Python 3.4
-                if hasattr(tree, "starargs"): tree.starargs = rec(tree.starargs)
-                if hasattr(tree, "kwargs"): tree.kwargs = rec(tree.kwargs)
+                tree.args = [rec(x) for x in tree.args]
+                tree.keywords = [rec(x) for x in tree.keywords]
+                if _py34_starargs:
+                    tree.starargs = rec(getattr(tree, "starargs", None))
+                    tree.kwargs = rec(getattr(tree, "kwargs", None))
             else:
                 stop()
                 ln, co = tree.lineno, tree.col_offset
@@ -307,27 +328,21 @@ def lazify(body):
                               keywords=[keyword(arg=k, value=q[ast_literal[x]]) for k, x in kwdata],
                               lineno=ln, col_offset=co)
 
-                if hasattr(tree, "starargs"):  # *args in Python 3.4
-                    if tree.starargs is not None:
-                        mycall.starargs = transform_starred(tree.starargs)
-                    else:
-                        mycall.starargs = None
-                if hasattr(tree, "kwargs"):  # **kwargs in Python 3.4
-                    if tree.kwargs is not None:
-                        mycall.kwargs = transform_starred(tree.kwargs, dstarred=True)
-                    else:
-                        mycall.kwargs = None
+                if _py34_starargs:  # *args and **kwargs in Python 3.4
+                    starargs, kwargs = getattr(tree, "starargs", None), getattr(tree, "kwargs", None)
+                    mycall.starargs = transform_starred(starargs) if starargs is not None else None
+                    mycall.kwargs = transform_starred(kwargs, dstarred=True) if kwargs is not None else None
 
                 tree = mycall
 
-        elif type(tree) is Subscript:  # force only accessed part of obj[...]
+        elif tt is Subscript:  # force only accessed part of obj[...]
             stop()
             tree.slice = rec(tree.slice, forcing_mode="full")
             # resolve reference to the actual container without forcing its items.
             tree.value = rec(tree.value, forcing_mode="flat")
-            tree = f(tree)
+            tree = _force_by_mode(tree, forcing_mode)
 
-        elif type(tree) is Attribute:
+        elif tt is Attribute:
             #   a.b.c --> f(force1(force1(a).b).c)  (Load)
             #         -->   force1(force1(a).b).c   (Store)
             #   attr="c", value=a.b
@@ -345,11 +360,11 @@ def lazify(body):
             #  in reality there is always an f() around the whole expr.)
             stop()
             tree.value = rec(tree.value, forcing_mode="flat")
-            tree = f(tree)
+            tree = _force_by_mode(tree, forcing_mode)
 
-        elif type(tree) is Name and type(tree.ctx) is Load:
+        elif tt is Name and type(tree.ctx) is Load:
             stop()  # must not recurse when a Name changes into a Call.
-            tree = f(tree)
+            tree = _force_by_mode(tree, forcing_mode)
 
         return tree
 
@@ -16,13 +16,16 @@ def where(*bindings):
 
 # avoid circular dependency; can't import from .util, so implement a minimal isx() for what we need
 def _isx(tree, x):
-    ismatch = x if callable(x) else lambda s: s == x
-    return (type(tree) is Name and ismatch(tree.id)) or \
-           (type(tree) is Captured and ismatch(tree.name))
+    t = type(tree)
+    if t is Name:
+        s = tree.id
+    elif t is Captured:
+        s = tree.name
+    else:
+        return False
+    return x(s) if callable(x) else s == x
 def _pred(x):
-    rematch = re.match
-    pat = re.compile(r"^{}\d*$".format(x))
-    return lambda s: rematch(pat, s)
+    return re.compile(r"^{}\d*$".format(x)).match
 _isletf = _pred("letter")  # name must match what ``unpythonic.syntax.letdo._letimpl`` uses in its output.
 _isdof = _pred("dof")      # name must match what ``unpythonic.syntax.letdo.do`` uses in its output.
 _iscurrycall = _pred("currycall")  # output of ``unpythonic.syntax.curry``
@@ -113,7 +116,7 @@ def islet(tree, expanded=True):
                  "blet", "bletseq", "bletrec")
     if type(tree) is Call and type(tree.func) is Name:
         s = tree.func.id
-        if any(s == x for x in deconames):
+        if s in deconames:
             return ("decorator", s)
     # otherwise we should have an expr macro invocation
     if not (type(tree) is Subscript and type(tree.slice) is Index):
@@ -124,12 +127,12 @@ def islet(tree, expanded=True):
     # let((k0, v0), ...)[body]
     if type(macro) is Call and type(macro.func) is Name:
         s = macro.func.id
-        if any(s == x for x in exprnames):
+        if s in exprnames:
             return ("lispy_expr", s)
     # The haskelly syntaxes are only available as a let expression (no decorator form).
     elif type(macro) is Name:
         s = macro.id
-        if not any(s == x for x in exprnames):
+        if s not in exprnames:
             return False
         h = _ishaskellylet(expr)
         if h:
@@ -197,7 +200,7 @@ def isdo(tree, expanded=True):
         return kind
     # TODO: detect also do[] with a single expression inside? (now requires a comma)
     return type(tree) is Subscript and \
-           type(tree.value) is Name and any(tree.value.id == x for x in ("do", "do0")) and \
+           type(tree.value) is Name and tree.value.id in ("do", "do0") and \
            type(tree.slice) is Index and type(tree.slice.value) is Tuple
 
 def isenvassign(tree):
@@ -8,22 +8,26 @@ Auto-print top-level expressions, auto-assign last result as _.
 
 from ast import Expr
 
-from macropy.core.quotes import macros, q, ast_literal
+from macropy.core.quotes import macros, q, name, ast_literal
 
 def nb(body, args):
-    p = args[0] if args else q[print]  # custom print function hook
     newbody = []
     with q as init:
         _ = None
-        theprint = ast_literal[p]
     newbody.extend(init)
+    if args:  # custom print function hook
+        with q as init:
+            theprint = ast_literal[args[0]]
+        newbody.extend(init)
     for stmt in body:
         if type(stmt) is not Expr:
             newbody.append(stmt)
             continue
+        # fresh node per site; later passes may edit the tree in place
+        printer = q[name["theprint"]] if args else q[print]
         with q as newstmts:
             _ = ast_literal[stmt.value]
             if _ is not None:
-                theprint(_)
+                ast_literal[printer](_)
         newbody.extend(newstmts)
     return newbody
@@ -109,6 +109,12 @@ def test():
             ec(g(21))
         assert result == 42
 
+        # the ec is detected by its position in the call_ec'd function, not by its name
+        @call_ec
+        def result(myexit):
+            return myexit(42)
+        assert result == 42
+
 #        # ec doesn't work from inside a continuation, because the function
 #        # containing the "call_cc" actually tail-calls the continuation and exits.
 #        @call_ec
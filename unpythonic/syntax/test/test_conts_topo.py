@@ -4,15 +4,14 @@
 For pictures, see ``macro_extras/callcc_topology.pdf`` in the source distribution.
 """
 
-from inspect import stack
+from sys import _getframe
 
 from ...syntax import macros, continuations, call_cc
 
 def me():
     """Return the caller's function name."""
-    callstack = stack()
-    framerecord = callstack[1]  # ignore me() itself, get caller's record
-    return framerecord[3]       # function name
+    # Unlike inspect.stack(), this doesn't build records for the whole call chain.
+    return _getframe(1).f_code.co_name  # ignore me() itself, get caller's name
 
 def test():
     # basic case: one continuation
@@ -11,6 +11,7 @@ from functools import wraps
 from ...fun import withself, curry
 from ...tco import trampolined, jump
 from ...fploop import looped_over
+from ...misc import namelambda
 
 def test():
     with multilambda:
@@ -89,6 +90,11 @@ def test():
         assert f5(10) == (2, 3, 100)
         assert f5.__name__ == "f5"
 
+        # a lambda that already has an explicit name keeps it
+        f8 = namelambda("x")(lambda x: x**2)
+        assert f8(10) == 100
+        assert f8.__name__ == "x"
+
     # also autocurry with a lambda as the last argument is recognized
     # TODO: fix MacroPy #21 properly; https://github.com/azazel75/macropy/issues/21
     with namedlambda:
@@ -103,6 +103,12 @@ def test():
         result = call_ec(lambda ec: do[print("hi2"), ec(g(21)), print("ho2")])
         assert result == 42
 
+        # the ec is detected by its position in the call_ec'd function, not by its name
+        @call_ec
+        def result(myexit):
+            return myexit(42)
+        assert result == 42
+
     # curry combo
     def testcurrycombo():
         with tco:
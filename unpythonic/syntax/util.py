@@ -5,9 +5,9 @@ from functools import partial
 import re
 
 from ast import Call, Name, Attribute, Lambda, FunctionDef, \
-                If, Num, NameConstant, For, While, With, Try, ClassDef, \
+                If, Num, Str, Bytes, NameConstant, For, While, With, Try, ClassDef, \
                 withitem
-from .astcompat import AsyncFunctionDef, AsyncFor, AsyncWith
+from .astcompat import AsyncFunctionDef, AsyncFor, AsyncWith, Constant, _NoSuchNodeType
 
 from macropy.core import Captured
 from macropy.core.walkers import Walker
@@ -39,10 +39,10 @@ def isx(tree, x, accept_attr=True):
     # Captured nodes only come from unpythonic.syntax, and we use from-imports
     # and bare names for anything hq[]'d; but any references that appear
     # explicitly in the user code may use either bare names or somemodule.f.
-    ismatch = x if callable(x) else lambda s: s == x
-    return (type(tree) is Name and ismatch(tree.id)) or \
-           (type(tree) is Captured and ismatch(tree.name)) or \
-           (accept_attr and type(tree) is Attribute and ismatch(tree.attr))
+    name = getname(tree, accept_attr)
+    if name is None:
+        return False
+    return x(name) if callable(x) else name == x
 
 def make_isxpred(x):
     """Make a predicate for isx.
@@ -51,9 +51,7 @@ def make_isxpred(x):
     x, x1, x2, ..., so that it works also with captured identifiers renamed
     by MacroPy's ``hq[]``.
     """
-    rematch = re.match
-    pat = re.compile(r"^{}\d*$".format(x))
-    return lambda s: rematch(pat, s)
+    return re.compile(r"^{}\d*$".format(x)).match
 
 def getname(tree, accept_attr=True):
     """The cousin of ``isx``.
@@ -62,11 +60,12 @@ def getname(tree, accept_attr=True):
 
     If no match on ``tree``, return ``None``.
     """
-    if type(tree) is Name:
+    t = type(tree)
+    if t is Name:
         return tree.id
-    if type(tree) is Captured:
+    if t is Captured:
         return tree.name
-    if accept_attr and type(tree) is Attribute:
+    if accept_attr and t is Attribute:
         return tree.attr
     return None
 
@@ -79,6 +78,7 @@ def isec(tree, known_ecs):
     """
     return type(tree) is Call and type(tree.func) is Name and tree.func.id in known_ecs
 
+_iscallec = partial(isx, x=make_isxpred("call_ec"))
 def detect_callec(tree):
     """Collect names of escape continuations from call_ec invocations in tree.
 
@@ -101,20 +101,26 @@ def detect_callec(tree):
     # literal function names that are always interpreted as an ec.
     # "brk" is needed to combo with unpythonic.fploop.breakably_looped.
     fallbacks = ["ec", "brk"]
-    iscallec = partial(isx, make_isxpred("call_ec"))
     @Walker
     def detect(tree, *, collect, **kw):
         # TODO: add support for general use of call_ec as a function (difficult)
-        if type(tree) in (FunctionDef, AsyncFunctionDef) and any(iscallec(deco) for deco in tree.decorator_list):
+        if type(tree) in (FunctionDef, AsyncFunctionDef) and any(_iscallec(deco) for deco in tree.decorator_list):
             fdef = tree
             collect(fdef.args.args[0].arg)  # FunctionDef.arguments.(list of arg objects).arg
-        elif is_decorated_lambda(tree, mode="any"):
-            decorator_list, thelambda = destructure_decorated_lambda(tree)
-            if any(iscallec(decocall.func) for decocall in decorator_list):
-                collect(thelambda.args.args[0].arg)  # we assume it's the first arg, as that's what call_ec expects.
+        else:
+            match = _match_decorated_lambda(tree, mode="any")
+            if match:
+                decorator_list, thelambda = match
+                if any(_iscallec(decocall.func) for decocall in decorator_list):
+                    collect(thelambda.args.args[0].arg)  # we assume it's the first arg, as that's what call_ec expects.
         return tree
     return fallbacks + detect.collect(tree)
 
+# node types that cannot have a Lambda (or a do[]) anywhere inside them
+# (Python 3.8+ parses all literals as Constant)
+_lambdaless_leaves = frozenset(t for t in (Name, Num, Str, Bytes, NameConstant, Constant)
+                               if t is not _NoSuchNodeType)
+
 @Walker
 def detect_lambda(tree, *, collect, stop, **kw):
     """Find lambdas in tree. Helper for block macros.
@@ -131,6 +137,9 @@ def detect_lambda(tree, *, collect, stop, **kw):
     to allow other block macros to better work together with ``with multilambda``
     (which expands in the first pass, to eliminate semantic surprises).
     """
+    if type(tree) in _lambdaless_leaves:
+        stop()
+        return tree
     if isdo(tree):
         stop()
         thebody = ExpandedDoView(tree).body
@@ -177,6 +186,23 @@ def is_lambda_decorator(tree, fname=None):
     return (type(tree) is Call and len(tree.args) == 1) and \
            (fname is None or is_decorator(tree.func, fname))
 
+def _decorator_name(tree):
+    """Return the name of the decorator ``tree``, or ``None``.
+
+    Matches the same trees as ``is_decorator``, but extracts the name once,
+    so that it can be looked up instead of tested against each candidate.
+    """
+    name = getname(tree)
+    if name is None and type(tree) is Call:  # parametric decorator
+        name = getname(tree.func)
+    return name
+
+def _lambda_decorator_name(tree):
+    """Like ``_decorator_name``, but matching the trees of ``is_lambda_decorator``."""
+    if type(tree) is not Call or len(tree.args) != 1:
+        return None
+    return _decorator_name(tree.func)
+
 def is_decorated_lambda(tree, mode):
     """Detect a tree of the form f(g(h(lambda ...: ...)))
 
@@ -191,21 +217,28 @@ def is_decorated_lambda(tree, mode):
     Note this works also for parametric decorators; for them, the ``func``
     of the ``Call`` is another ``Call`` (that specifies the parameters).
     """
+    return _match_decorated_lambda(tree, mode) is not None
+
+def _match_decorated_lambda(tree, mode):
+    """Combined ``is_decorated_lambda`` and ``destructure_decorated_lambda``.
+
+    Return ``(decorator_list, thelambda)`` if ``tree`` is a decorated lambda,
+    else ``None``. Walks the call chain only once.
+    """
     assert mode in ("known", "any")
     if mode == "known":
-        detectors = [partial(is_lambda_decorator, fname=x) for x in all_decorators]
+        def isdeco(tree):
+            return _lambda_decorator_name(tree) in all_decorators
     else: # mode == "any":
-        detectors = [is_lambda_decorator]
-
-    def detect(tree):
-        if type(tree) is not Call:
-            return False
-        if not any(f(tree) for f in detectors):
-            return False
-        if type(tree.args[0]) is Lambda:
-            return True
-        return detect(tree.args[0])
-    return detect(tree)
+        isdeco = is_lambda_decorator
+
+    lst = []
+    while type(tree) is Call and isdeco(tree):
+        lst.append(tree)
+        tree = tree.args[0]
+        if type(tree) is Lambda:
+            return lst, tree
+    return None
 
 def destructure_decorated_lambda(tree):
     """Get the AST nodes for ([f, g, h], lambda) in f(g(h(lambda ...: ...)))
@@ -214,14 +247,13 @@ def destructure_decorated_lambda(tree):
 
     This returns **the original AST nodes**, to allow in-place transformations.
     """
-    def get(tree, lst):
-        if type(tree) is Call:
-            # collect tree itself, not tree.func, because sort_lambda_decorators needs to reorder the funcs.
-            return get(tree.args[0], lst + [tree])
-        elif type(tree) is Lambda:
-            return lst, tree
-        assert False, "Expected a chain of Call nodes terminating in a Lambda node"
-    return get(tree, [])
+    lst = []
+    while type(tree) is Call:
+        # collect tree itself, not tree.func, because sort_lambda_decorators needs to reorder the funcs.
+        lst.append(tree)
+        tree = tree.args[0]
+    assert type(tree) is Lambda, "Expected a chain of Call nodes terminating in a Lambda node"
+    return lst, tree
 
 def has_tco(tree, userlambdas=[]):
     """Return whether a FunctionDef or a decorated lambda has TCO applied.
@@ -234,6 +266,7 @@ def has_tco(tree, userlambdas=[]):
     """
     return has_deco(tco_decorators, tree, userlambdas)
 
+_curry_names = frozenset(("curry",))
 def has_curry(tree, userlambdas=[]):
     """Return whether a FunctionDef or a decorated lambda has curry applied.
 
@@ -243,12 +276,16 @@ def has_curry(tree, userlambdas=[]):
     Return value is ``True`` or ``False`` (depending on test result) if the
     test was applicable, and ``None`` if it was not applicable (no match on tree).
     """
-    return has_deco(["curry"], tree, userlambdas)
+    return has_deco(_curry_names, tree, userlambdas)
+
+def _as_set(names):
+    return names if isinstance(names, (set, frozenset)) else set(names)
 
 def has_deco(deconames, tree, userlambdas=[]):
     """Return whether a FunctionDef or a decorated lambda has any given deco applied.
 
-    deconames: list of decorator names to test.
+    deconames: collection of decorator names to test. A set (or frozenset)
+    is used as-is; anything else is converted to one.
 
     userlambdas: list of ``id(some_tree)``; when detecting a lambda,
     only consider it if its id matches one of those in the list.
@@ -257,11 +294,14 @@ def has_deco(deconames, tree, userlambdas=[]):
     test was applicable, and ``None`` if it was not applicable (no match on tree).
     """
     if type(tree) in (FunctionDef, AsyncFunctionDef):
-        return any(is_decorator(x, fname) for fname in deconames for x in tree.decorator_list)
-    elif is_decorated_lambda(tree, mode="any"):
-        decorator_list, thelambda = destructure_decorated_lambda(tree)
+        deconames = _as_set(deconames)
+        return any(_decorator_name(x) in deconames for x in tree.decorator_list)
+    match = _match_decorated_lambda(tree, mode="any")
+    if match:
+        decorator_list, thelambda = match
         if (not userlambdas) or (id(thelambda) in userlambdas):
-            return any(is_lambda_decorator(x, fname) for fname in deconames for x in decorator_list)
+            deconames = _as_set(deconames)
+            return any(_lambda_decorator_name(x) in deconames for x in decorator_list)
     return None  # not applicable
 
 def sort_lambda_decorators(tree):
@@ -277,23 +317,31 @@ def sort_lambda_decorators(tree):
         call_ec(curry(trampolined(lambda ...: ...)))
             --> trampolined(call_ec(curry(lambda ...: ...)))
     """
+    # The registry may grow between calls, so snapshot it here, not at import time.
+    priorities = {}
+    for k, (pri, fname) in enumerate(decorator_registry):
+        priorities.setdefault(fname, k)
     def prioritize(tree):  # sort key for Call nodes invoking known decorators
-        for k, (pri, fname) in enumerate(decorator_registry):
-            if is_lambda_decorator(tree, fname):
-                return k
+        k = priorities.get(_lambda_decorator_name(tree))
+        if k is not None:
+            return k
         x = getname(tree.func) if type(tree) is Call else "<unknown>"
         assert False, "Only registered decorators can be auto-sorted, '{:s}' is not; see unpythonic.regutil".format(x)
 
     @Walker
     def fixit(tree, *, stop, **kw):
         # we can robustly sort only decorators for which we know the correct ordering.
-        if is_decorated_lambda(tree, mode="known"):
-            decorator_list, thelambda = destructure_decorated_lambda(tree)
+        match = _match_decorated_lambda(tree, mode="known")
+        if match:
+            decorator_list, thelambda = match
             # We can just swap the func attributes of the nodes.
-            ordered_decorator_list = sorted(decorator_list, key=prioritize)
-            ordered_funcs = [x.func for x in ordered_decorator_list]
-            for thecall, newfunc in zip(decorator_list, ordered_funcs):
-                thecall.func = newfunc
+            # Usually the chain is already in order (e.g. we sorted it on an earlier pass).
+            keys = [prioritize(x) for x in decorator_list]
+            if any(k1 > k2 for k1, k2 in zip(keys, keys[1:])):
+                order = sorted(range(len(keys)), key=keys.__getitem__)
+                ordered_funcs = [decorator_list[j].func for j in order]
+                for thecall, newfunc in zip(decorator_list, ordered_funcs):
+                    thecall.func = newfunc
             # don't recurse on the tail of the "decorator list" (call chain),
             # but recurse into the lambda body.
             stop()
@@ -319,7 +367,18 @@ def suggest_decorator_index(deco_name, decorator_list):
     """
     if deco_name not in all_decorators:
         return None  # unknown decorator, don't know where it should go
-    names = [getname(tree) for tree in decorator_list]
+    names = tuple(getname(tree) for tree in decorator_list)
+    # The answer depends only on the names and on the registry, which only
+    # ever grows; so its length identifies its state.
+    key = (deco_name, names, len(decorator_registry))
+    try:
+        return _decorator_index_cache[key]
+    except KeyError:
+        k = _decorator_index_cache[key] = _suggest_decorator_index(deco_name, names)
+        return k
+
+_decorator_index_cache = {}
+def _suggest_decorator_index(deco_name, names):
     pri_by_name = {dname: pri for pri, dname in decorator_registry}
 
     # sanity check that existing known decorators are ordered correctly
@@ -344,7 +403,7 @@ def suggest_decorator_index(deco_name, decorator_list):
     if targetpri < knownpris[0]:
         return 0
     if targetpri > knownpris[-1]:
-        return len(decorator_list)
+        return len(names)
     for pri, dname in zip(knownpris, knownnames):
         if targetpri >= pri:
             break
@@ -162,6 +162,9 @@ class _jump:
     If you have already packed args and kwargs, you can instantiate this
     directly; the public API just performs the packing.
     """
+    # One instance per tail call, so skip the per-instance __dict__.
+    __slots__ = ("target", "args", "kwargs", "_claimed")
+
     def __init__(self, target, args, kwargs):
         # IMPORTANT: don't let target bring along its trampoline if it has one
         self.target = target._entrypoint if hasattr(target, "_entrypoint") else target
@@ -153,6 +153,11 @@ def test():
     assert lst == [0, 1, 10, 20, 4]
     assert v[-1] == 20
 
+    lst = list(range(5))
+    v = view(lst)[:3]
+    v[::-1] = (10, 20, 30)
+    assert lst == [30, 20, 10, 3, 4]
+
     # writing a scalar value into a slice broadcasts it, à la NumPy
     lst = list(range(5))
     v = view(lst)[2:4]
@@ -101,6 +101,13 @@ def test():
     c = cosser(1)
     assert c == cos(c)  # 0.7390851332151607
 
+    # unwrap is applied to the return value of f; e.g. force a promise.
+    @fix(justargs, unwrap=lambda thunk: thunk())
+    def cosser3(x):
+        return lambda: cosser3(cos(x))
+    c = cosser3(1)
+    assert c == cos(c)
+
     # General pattern to find a fixed point with this strategy:
     from functools import partial
     @fix(justargs)
@@ -110,6 +117,12 @@ def test():
     f, c = cosser2(1)  # f ends up in the return value because it's in the args of iterate1_rec.
     assert c == cos(c)
 
+    # custom key, e.g. for unhashable args
+    @fix(key=tuple)
+    def h(lst):
+        return h([(lst[0] + 1) % 3])
+    assert h([0]) is NoReturn
+
     # fix with no args - default no-return return value
     @fix()
     def f(k):
@@ -27,6 +27,8 @@ def test():
     # reduce is a fold with a single input, with init optional.
     assert reducel(add, (1, 2, 3)) == 6
     assert reducer(add, (1, 2, 3)) == 6
+    assert reducel(add, (1, 2, 3), 0) == 6  # falsey init is still an init
+    assert prod((), start=0) == 0
 
     # scanl1, scanr1 are a scan with a single input, with init optional.
     assert tuple(scanl1(add, (1, 2, 3))) == (1, 3, 6)
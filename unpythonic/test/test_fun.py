@@ -7,7 +7,7 @@ from ..fun import memoize, curry, apply, \
                   andf, orf, notf, \
                   flip, rotate, \
                   composel1, composer1, composel, composer, \
-                  to1st, to2nd, tolast, to, \
+                  to1st, to2nd, tokth, tolast, to, \
                   withself
 
 from ..dynassign import dyn
@@ -24,6 +24,59 @@ def test():
     f(3)
     assert all(n == 1 for n in evaluations.values())
 
+    # kwargs are matched regardless of the order they are passed in
+    evaluations = Counter()
+    @memoize
+    def g(a, b):
+        evaluations[(a, b)] += 1
+        return a - b
+    assert g(a=3, b=2) == 1
+    assert g(b=2, a=3) == 1
+    assert g(3, 2) == 1  # different call signature, so evaluated separately
+    assert evaluations[(3, 2)] == 2
+
+    # bounded memo: keep only the maxsize most recently used entries
+    evaluations = Counter()
+    @memoize(maxsize=2)
+    def h(x):
+        evaluations[x] += 1
+        return 2 * x
+    h(1)
+    h(2)
+    h(1)  # hit; now 2 is the least recently used
+    h(3)  # evicts 2
+    h(1)
+    assert evaluations[1] == 1
+    h(2)
+    assert evaluations[2] == 2
+    h.cache_clear()
+    h(3)
+    assert evaluations[3] == 2
+
+    # exceptions are memoized also in the bounded memo, and evicted like values
+    evaluations = Counter()
+    @memoize(maxsize=1)
+    def fails(x):
+        evaluations[x] += 1
+        raise ValueError(x)
+    for _ in range(2):
+        try:
+            fails(1)
+        except ValueError:
+            pass
+        else:
+            assert False, "should have raised"
+    assert evaluations[1] == 1
+    try:
+        fails(2)  # evicts 1
+    except ValueError:
+        pass
+    try:
+        fails(1)
+    except ValueError:
+        pass
+    assert evaluations[1] == 2
+
     # "memoize lambda": classic evaluate-at-most-once thunk
     thunk = memoize(lambda: print("hi from thunk"))
     thunk()
@@ -169,12 +222,15 @@ def test():
     assert to1st(double)(1, 2, 3)  == (2, 2, 3)
     assert to2nd(double)(1, 2, 3)  == (1, 4, 3)
     assert tolast(double)(1, 2, 3) == (1, 2, 6)
+    assert tolast(double)(1) == (2,)
+    assert tokth(-1, double)(1) == (2,)
 
     processor = to((0, double),
                    (-1, inc),
                    (1, composer(double, double)),
                    (0, inc))
     assert processor(1, 2, 3) == (3, 8, 4)
+    assert to()(1, 2, 3) == (1, 2, 3)  # no specs: pass through
 
     assert identity(1, 2, 3) == (1, 2, 3)
     assert identity(42) == 42
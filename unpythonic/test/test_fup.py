@@ -27,6 +27,13 @@ def test():
     assert lst == [1, 2, 3]
     assert out == [1, 2, 42]
 
+    # one item in a tuple
+    lst = (1, 2, 3)
+    out = fupdate(lst, 0, 42)
+    assert lst == (1, 2, 3)
+    assert out == (42, 2, 3)
+    assert type(out) is type(lst)
+
     # no start index
     lst = (1, 2, 3, 4, 5)
     out = fupdate(lst, slice(None, 5, 2), tuple(repeat(10, 3)))